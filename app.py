@@ -1,11 +1,63 @@
-from flask import Flask
+import os
+import sqlite3
+import time
+
+from flask import Flask, Response
 
 app = Flask(__name__)
 
+# The bot (main.py) writes its metrics snapshot to this SQLite file every few seconds
+METRICS_DB_PATH = os.getenv("METRICS_DB_PATH") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "metrics.db")
+
 @app.route('/')
 def hello():
     return 'Hello, World!'
 
+def format_value(value):
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+def read_metrics():
+    """Render the bot's snapshot in the Prometheus text format"""
+    conn = sqlite3.connect(f"file:{METRICS_DB_PATH}?mode=ro", uri=True, timeout=2)
+    try:
+        meta = {name: (kind, help_text) for name, kind, help_text in conn.execute("SELECT name, kind, help FROM metric_meta")}
+        rows = conn.execute("SELECT family, name, labels, value FROM metrics ORDER BY rowid").fetchall()
+        row = conn.execute("SELECT value FROM metric_state WHERE key = 'updated_at'").fetchone()
+    finally:
+        conn.close()
+
+    lines = []
+    current = None
+    for family, name, labels, value in rows:
+        if family != current:
+            current = family
+            kind, help_text = meta.get(family, ("untyped", family))
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+        series = f"{name}{{{labels}}}" if labels else name
+        lines.append(f"{series} {format_value(value)}")
+    return lines, row[0] if row else None
+
+@app.route('/metrics')
+def metrics():
+    try:
+        lines, updated_at = read_metrics()
+        up = 1
+    except sqlite3.Error:
+        lines, updated_at = [], None
+        up = 0
+
+    lines.append("# HELP bot_metrics_up Whether the bot's metrics snapshot could be read")
+    lines.append("# TYPE bot_metrics_up gauge")
+    lines.append(f"bot_metrics_up {up}")
+    if updated_at is not None:
+        lines.append("# HELP bot_metrics_age_seconds Seconds since the bot last wrote its snapshot")
+        lines.append("# TYPE bot_metrics_age_seconds gauge")
+        lines.append(f"bot_metrics_age_seconds {format_value(round(time.time() - updated_at, 3))}")
+    return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
+
 if __name__ == '__main__':
     # Run the Flask app on port 1000
-    app.run(host='0.0.0.0', port=1000)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=1000)